@@ -18,15 +18,18 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import customtkinter as ctk
 import threading
+import queue
+import functools
 import os
 import sys
+import math
 from pathlib import Path
 import json
 from datetime import datetime
 import numpy as np
 import cv2
-from PIL import Image, ImageTk, ImageDraw
-import pandas as pd
+from PIL import Image, ImageTk
+import xlsxwriter
 
 # Import our existing modules
 from document_processor import DocumentProcessor
@@ -40,6 +43,12 @@ ctk.set_default_color_theme("blue")  # Themes: "blue", "green", "dark-blue"
 class CountFireProApp(ctk.CTk):
     """Main desktop application class"""
     
+    _INVALID_SHEET_CHARS = str.maketrans('', '', '[]:*?/\\')
+    
+    # Zooming in stops at this multiple of the page's own resolution, since the
+    # whole zoomed page is rendered into the canvas image
+    _MAX_DISPLAY_SCALE = 2.0
+    
     def __init__(self):
         super().__init__()
         
@@ -56,13 +65,28 @@ class CountFireProApp(ctk.CTk):
         # Application state
         self.current_document = None
         self.current_image = None
-        self.sections = []
+        self.current_image_rgb = None
+        self.pyramid = None
+        self._display_base = None
+        self._last_render_key = None
         self.symbol_results = {}
-        self.canvas_scale = 1.0
+        self.canvas_scale = 1.0  # Display scale: fit-to-canvas scale times zoom_factor
+        self.zoom_factor = 1.0   # User zoom relative to the fitted view
+        self._canvas2img = (1.0, 0.0, 1.0, 0.0)  # (sx, tx, sy, ty) canvas -> image affine
+        self._pending_zoom = None
+        self._zoom_after = None
         self.drawing_rectangles = []
         self.is_drawing = False
         self.start_x = None
         self.start_y = None
+        self._cur_xy = None
+        self._temp_pending = False
+        
+        # Background worker: jobs run on one persistent thread. Every UI update coming
+        # from another thread goes through _ui_q and is run by the main-thread pump.
+        self._jobs = queue.Queue()
+        self._ui_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
         
         # Setup UI
         self.setup_ui()
@@ -70,6 +94,9 @@ class CountFireProApp(ctk.CTk):
         # Load settings
         self.load_settings()
         
+        # Run UI updates posted by background threads
+        self.after(16, self._pump_ui)
+        
     def setup_ui(self):
         """Initialize the user interface"""
         
@@ -253,6 +280,10 @@ class CountFireProApp(ctk.CTk):
         )
         self.canvas.grid(row=0, column=0, sticky="nsew")
         
+        # Persistent image item; display_image updates it in place
+        self.tk_image = ImageTk.PhotoImage(Image.new("RGB", (1, 1)))
+        self._canvas_img_id = self.canvas.create_image(0, 0, anchor="nw", image=self.tk_image)
+        
         # Scrollbars
         self.v_scrollbar = ttk.Scrollbar(self.canvas_frame, orient="vertical", command=self.canvas.yview)
         self.v_scrollbar.grid(row=0, column=1, sticky="ns")
@@ -305,81 +336,175 @@ class CountFireProApp(ctk.CTk):
         
         if filename:
             self.set_status("Processing document...")
-            threading.Thread(
-                target=self._process_document_thread,
-                args=(filename,),
-                daemon=True
-            ).start()
+            self.pyramid = None
+            self.submit_job(
+                self._process_document_thread,
+                (filename,),
+                functools.partial(self._document_processed, filename),
+                self._document_error
+            )
     
     def _process_document_thread(self, filename):
-        """Process document in a separate thread"""
-        try:
-            # Process the document
-            with open(filename, 'rb') as file:
-                self.current_image = self.doc_processor.process_document(file)
-            
-            # Update UI in main thread
-            self.after(0, self._document_processed, filename)
-            
-        except Exception as e:
-            self.after(0, self._document_error, str(e))
+        """Process document on the background worker thread"""
+        # Process the document (images are decoded straight from disk)
+        file_extension = Path(filename).suffix.lower().lstrip('.')
+        if file_extension in self.doc_processor.supported_image_formats:
+            return self.doc_processor.process_image_path(filename)
+        
+        with open(filename, 'rb') as file:
+            return self.doc_processor.process_document(file)
     
-    def _document_processed(self, filename):
+    def _document_processed(self, filename, image):
         """Handle successful document processing"""
         self.current_document = filename
-        self.display_image()
-        self.set_status(f"Loaded: {os.path.basename(filename)}")
+        self.current_image = image
         
         # Clear previous data
-        self.sections = []
+        self.section_manager.clear_sections()
         self.symbol_results = {}
         self.drawing_rectangles = []
+        self.zoom_factor = 1.0
+        self.symbol_detector.clear_cache()
         self.update_sections_list()
         
+        self._build_pyramid()
+        self.display_image()
+        self.set_status(f"Loaded: {os.path.basename(filename)}")
+        
     def _document_error(self, error_msg):
         """Handle document processing error"""
         messagebox.showerror("Error", f"Failed to process document:\n{error_msg}")
         self.set_status("Error loading document")
     
+    def _build_pyramid(self):
+        """Build a 2x-downsampled display pyramid for the current image"""
+        self.pyramid = None
+        self.current_image_rgb = None
+        self._last_render_key = None
+        if self.current_image is None:
+            return
+        
+        # DocumentProcessor already returns RGB, so the display can use the pixels
+        # directly; only make sure they are contiguous for cv2/PIL
+        level = np.ascontiguousarray(self.current_image)
+        self.current_image_rgb = level
+        
+        # Halve the image until the next level would drop below 256 px
+        pyramid = [(level, 1.0)]
+        while min(level.shape[:2]) // 2 >= 256:
+            level = cv2.pyrDown(level)
+            pyramid.append((level, 0.5 ** len(pyramid)))
+        
+        self.pyramid = pyramid
+    
     def display_image(self):
         """Display the current image on canvas"""
         if self.current_image is None:
             return
         
-        # Convert to PIL Image
-        if isinstance(self.current_image, np.ndarray):
-            if len(self.current_image.shape) == 3:
-                pil_image = Image.fromarray(cv2.cvtColor(self.current_image, cv2.COLOR_BGR2RGB))
-            else:
-                pil_image = Image.fromarray(self.current_image)
-        else:
-            pil_image = self.current_image
+        if self.pyramid is None:
+            self._build_pyramid()
         
         # Scale image to fit canvas
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
         if canvas_width > 1 and canvas_height > 1:  # Canvas is initialized
-            # Calculate scale to fit
-            img_width, img_height = pil_image.size
+            # Calculate scale to fit (the fitted view never upscales), then apply the user zoom,
+            # folding the display cap back into zoom_factor so zooming out responds at once
+            img_height, img_width = self.current_image_rgb.shape[:2]
             scale_x = canvas_width / img_width
             scale_y = canvas_height / img_height
-            self.canvas_scale = min(scale_x, scale_y, 1.0)  # Don't upscale
+            fit_scale = min(scale_x, scale_y, 1.0)
+            self.zoom_factor = min(self.zoom_factor, self._MAX_DISPLAY_SCALE / fit_scale)
+            self.canvas_scale = fit_scale * self.zoom_factor
             
-            # Resize image
-            new_width = int(img_width * self.canvas_scale)
-            new_height = int(img_height * self.canvas_scale)
-            self.display_pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # Skip the render if nothing that affects it has changed
+            render_key = (id(self.current_image), round(self.canvas_scale, 4), canvas_width, canvas_height)
+            if render_key == self._last_render_key:
+                return
             
-            # Convert to Tkinter format
-            self.tk_image = ImageTk.PhotoImage(self.display_pil_image)
+            # Cache the canvas -> image mapping once per render
+            inverse_scale = 1.0 / self.canvas_scale
+            self._canvas2img = (inverse_scale, 0.0, inverse_scale, 0.0)
             
-            # Display on canvas
-            self.canvas.delete("all")
-            self.canvas.create_image(0, 0, anchor="nw", image=self.tk_image)
+            # Pick the smallest pyramid level that is still at least as large as the target,
+            # so only a residual (<2x) resize is needed
+            level = max(0, math.floor(-math.log2(self.canvas_scale)))
+            level = min(level, len(self.pyramid) - 1)
+            level_image, _ = self.pyramid[level]
+            
+            # Resize image with OpenCV's SIMD kernels
+            new_width = max(1, int(img_width * self.canvas_scale))
+            new_height = max(1, int(img_height * self.canvas_scale))
+            if new_width < level_image.shape[1]:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_CUBIC
+            self._display_base = cv2.resize(level_image, (new_width, new_height), interpolation=interpolation)
             
-            # Configure scroll region
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self._render_display()
+            self._last_render_key = render_key
+    
+    def _render_display(self):
+        """Draw the rectangles onto the resized image and show it on the canvas"""
+        if self._display_base is None:
+            return
+        
+        display = self._display_base
+        if self.drawing_rectangles:
+            display = self._draw_rectangles(display)
+        
+        # Reuse the existing PhotoImage when the size is unchanged, otherwise replace it
+        # (keep a reference so Tk doesn't lose the image)
+        display = Image.fromarray(display)
+        if (self.tk_image.width(), self.tk_image.height()) == display.size:
+            self.tk_image.paste(display)
+        else:
+            self.tk_image = ImageTk.PhotoImage(display)
+            self.canvas.itemconfigure(self._canvas_img_id, image=self.tk_image)
+        
+        # Configure scroll region
+        self.canvas.configure(scrollregion=self.canvas.bbox(self._canvas_img_id))
+    
+    def _draw_rectangles(self, base):
+        """
+        Draw the drawn rectangles onto a copy of the display image
+        
+        Boxes are scaled to the display, so the work is proportional to the
+        displayed pixels rather than the full-resolution page. The translucent
+        fill is blended in integer math inside the union of the boxes only.
+        """
+        height, width = base.shape[:2]
+        img_height, img_width = self.current_image_rgb.shape[:2]
+        
+        # Image -> display coordinates, clipped to the display
+        boxes = np.array([rect['image_coords'] for rect in self.drawing_rectangles], dtype=np.float64)
+        x1 = np.clip(np.floor(boxes[:, 0] * width / img_width), 0, width).astype(np.int64)
+        y1 = np.clip(np.floor(boxes[:, 1] * height / img_height), 0, height).astype(np.int64)
+        x2 = np.clip(np.ceil((boxes[:, 0] + boxes[:, 2]) * width / img_width), 0, width).astype(np.int64)
+        y2 = np.clip(np.ceil((boxes[:, 1] + boxes[:, 3]) * height / img_height), 0, height).astype(np.int64)
+        visible = (x2 > x1) & (y2 > y1)
+        if not visible.any():
+            return base
+        x1, y1, x2, y2 = x1[visible], y1[visible], x2[visible], y2[visible]
+        
+        display = cv2.cvtColor(base, cv2.COLOR_GRAY2RGB) if base.ndim == 2 else base.copy()
+        
+        # Red fill at 20% opacity, blended in uint8 by OpenCV; overlapping boxes are tinted once
+        ux1, uy1, ux2, uy2 = int(x1.min()), int(y1.min()), int(x2.max()), int(y2.max())
+        mask = np.zeros((uy2 - uy1, ux2 - ux1), dtype=np.uint8)
+        for bx1, by1, bx2, by2 in zip((x1 - ux1).tolist(), (y1 - uy1).tolist(), (x2 - ux1).tolist(), (y2 - uy1).tolist()):
+            mask[by1:by2, bx1:bx2] = 1
+        region = display[uy1:uy2, ux1:ux2]
+        shaded = cv2.multiply(region, (1, 1, 1, 0), scale=(255 - 51) / 255)
+        cv2.add(shaded, (51, 0, 0, 0), dst=region, mask=mask)
+        
+        # Opaque 2 px outlines
+        for bx1, by1, bx2, by2 in zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist()):
+            cv2.rectangle(display, (bx1, by1), (bx2 - 1, by2 - 1), (255, 0, 0), 2)
+        
+        return display
     
     def start_drawing(self, event):
         """Start drawing a rectangle"""
@@ -395,17 +520,26 @@ class CountFireProApp(ctk.CTk):
         if not self.is_drawing:
             return
         
-        current_x = self.canvas.canvasx(event.x)
-        current_y = self.canvas.canvasy(event.y)
-        
-        # Remove previous temporary rectangle
-        self.canvas.delete("temp_rect")
+        # Only record the position here; the canvas is updated at most every 16 ms
+        self._cur_xy = (self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if not self._temp_pending:
+            self._temp_pending = True
+            self.after(16, self._flush_temp_rect)
+    
+    def _flush_temp_rect(self):
+        """Redraw the temporary rectangle at the latest drag position"""
+        self._temp_pending = False
+        if not self.is_drawing:
+            return
         
-        # Draw new temporary rectangle
-        self.canvas.create_rectangle(
-            self.start_x, self.start_y, current_x, current_y,
-            outline="red", width=2, fill="", tags="temp_rect"
-        )
+        current_x, current_y = self._cur_xy
+        if self.canvas.find_withtag("temp_rect"):
+            self.canvas.coords("temp_rect", self.start_x, self.start_y, current_x, current_y)
+        else:
+            self.canvas.create_rectangle(
+                self.start_x, self.start_y, current_x, current_y,
+                outline="red", width=2, fill="", tags="temp_rect"
+            )
     
     def end_drawing(self, event):
         """Finish drawing a rectangle"""
@@ -422,24 +556,22 @@ class CountFireProApp(ctk.CTk):
         
         if width > 10 and height > 10:
             # Convert canvas coordinates to image coordinates
-            img_x1 = int(min(self.start_x, end_x) / self.canvas_scale)
-            img_y1 = int(min(self.start_y, end_y) / self.canvas_scale)
-            img_width = int(width / self.canvas_scale)
-            img_height = int(height / self.canvas_scale)
+            sx, tx, sy, ty = self._canvas2img
+            img_x1 = int(min(self.start_x, end_x) * sx + tx)
+            img_y1 = int(min(self.start_y, end_y) * sy + ty)
+            img_width = int(width * sx)
+            img_height = int(height * sy)
             
-            # Store rectangle
+            # Store rectangle in image coordinates only; it is re-scaled onto every render
             rect_data = {
-                'canvas_coords': (self.start_x, self.start_y, end_x, end_y),
                 'image_coords': (img_x1, img_y1, img_width, img_height)
             }
             self.drawing_rectangles.append(rect_data)
             
-            # Remove temporary rectangle and draw permanent one
+            # Remove temporary rectangle and draw the permanent one into the displayed image,
+            # so the canvas holds a single image item regardless of rectangle count
             self.canvas.delete("temp_rect")
-            self.canvas.create_rectangle(
-                self.start_x, self.start_y, end_x, end_y,
-                outline="red", width=2, fill="rgba(255,0,0,0.2)", tags="rectangle"
-            )
+            self._render_display()
             
             self.set_status(f"Rectangle drawn. Total: {len(self.drawing_rectangles)}")
         else:
@@ -458,7 +590,7 @@ class CountFireProApp(ctk.CTk):
             return
         
         # Check for duplicate names
-        if any(s['name'] == section_name for s in self.sections):
+        if section_name in self.section_manager.names:
             messagebox.showwarning("Warning", "Section name already exists")
             return
         
@@ -484,7 +616,7 @@ class CountFireProApp(ctk.CTk):
                 img_height_full
             )
             
-            self.sections.append(section_data)
+            self.section_manager.add_section(section_data)
             self.update_sections_list()
             self.section_name_entry.delete(0, tk.END)
             self.set_status(f"Section '{section_name}' added")
@@ -492,8 +624,8 @@ class CountFireProApp(ctk.CTk):
     def update_sections_list(self):
         """Update the sections listbox"""
         self.sections_listbox.delete(0, tk.END)
-        for section in self.sections:
-            self.sections_listbox.insert(tk.END, section['name'])
+        for name in self.section_manager.names:
+            self.sections_listbox.insert(tk.END, name)
     
     def delete_selected_section(self):
         """Delete the selected section"""
@@ -502,10 +634,9 @@ class CountFireProApp(ctk.CTk):
             return
         
         index = selection[0]
-        section_name = self.sections[index]['name']
+        section_name = self.section_manager.remove_section(index)['name']
         
         # Remove from lists
-        del self.sections[index]
         if section_name in self.symbol_results:
             del self.symbol_results[section_name]
         
@@ -514,7 +645,7 @@ class CountFireProApp(ctk.CTk):
     
     def detect_symbols(self):
         """Detect symbols in all sections"""
-        if not self.sections:
+        if not len(self.section_manager):
             messagebox.showwarning("Warning", "Please add at least one section first")
             return
         
@@ -522,39 +653,42 @@ class CountFireProApp(ctk.CTk):
             messagebox.showwarning("Warning", "Please upload a document first")
             return
         
+        # Read the sliders here; Tk widgets must only be touched from the main thread
+        min_area = int(self.min_area_slider.get())
+        max_area = int(self.max_area_slider.get())
+        
+        # Snapshot the sections so deleting one during detection cannot shift the results
+        # (the coordinate array is replaced, never modified, when sections change)
+        sections = list(self.section_manager.sections)
+        coordinates = self.section_manager.coordinates
+        
         self.set_status("Detecting symbols...")
-        threading.Thread(
-            target=self._detect_symbols_thread,
-            daemon=True
-        ).start()
+        self.submit_job(
+            self._detect_symbols_thread,
+            (self.current_image, sections, coordinates, min_area, max_area),
+            self._symbols_detected,
+            self._detection_error
+        )
     
-    def _detect_symbols_thread(self):
-        """Detect symbols in a separate thread"""
-        try:
-            min_area = int(self.min_area_slider.get())
-            max_area = int(self.max_area_slider.get())
-            
-            results = {}
-            for section in self.sections:
-                section_results = self.symbol_detector.detect_symbols_in_section(
-                    self.current_image,
-                    section,
-                    min_area=min_area,
-                    max_area=max_area
-                )
-                results[section['name']] = section_results
-            
-            self.after(0, self._symbols_detected, results)
-            
-        except Exception as e:
-            self.after(0, self._detection_error, str(e))
+    def _detect_symbols_thread(self, image, sections, coordinates, min_area, max_area):
+        """Detect symbols on the background worker thread"""
+        # Sections are independent, so detect them in parallel threads (OpenCV releases the GIL)
+        results = self.symbol_detector.detect_symbols_in_sections(
+            image,
+            sections,
+            min_area=min_area,
+            max_area=max_area,
+            coordinates=coordinates
+        )
+        
+        return results
     
     def _symbols_detected(self, results):
         """Handle successful symbol detection"""
         self.symbol_results = results
         self.show_results()
         
-        total_symbols = sum(len(r['symbols']) for r in results.values())
+        total_symbols = sum(r['total_symbols'] for r in results.values())
         self.set_status(f"Detection complete: {total_symbols} symbols found")
     
     def _detection_error(self, error_msg):
@@ -581,32 +715,35 @@ class CountFireProApp(ctk.CTk):
         )
         text_widget.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Generate results text
-        results_text = "SYMBOL DETECTION RESULTS\n"
-        results_text += "=" * 50 + "\n\n"
+        # Generate results text (collect fragments and join once)
+        parts = ["SYMBOL DETECTION RESULTS\n", "=" * 50 + "\n\n"]
         
         total_symbols = 0
         for section_name, results in self.symbol_results.items():
-            symbol_count = len(results['symbols'])
+            symbol_count = results['total_symbols']
             total_symbols += symbol_count
             
-            results_text += f"Section: {section_name}\n"
-            results_text += f"Symbols found: {symbol_count}\n"
+            parts.append(f"Section: {section_name}\n")
+            parts.append(f"Symbols found: {symbol_count}\n")
             
-            if results['symbols']:
-                results_text += "Details:\n"
+            if symbol_count:
+                parts.append("Details:\n")
                 for i, symbol in enumerate(results['symbols'][:10]):  # Show first 10
-                    results_text += f"  #{i+1}: Area={symbol['area']}, Type={symbol['type']}\n"
-                if len(results['symbols']) > 10:
-                    results_text += f"  ... and {len(results['symbols']) - 10} more\n"
+                    parts.append(f"  #{i+1}: Area={symbol['area']}, Type={symbol['type']}\n")
+                if symbol_count > 10:
+                    parts.append(f"  ... and {symbol_count - 10} more\n")
             
-            results_text += "\n" + "-" * 30 + "\n\n"
+            parts.append("\n" + "-" * 30 + "\n\n")
         
-        results_text += f"TOTAL SYMBOLS: {total_symbols}\n"
-        results_text += f"SECTIONS PROCESSED: {len(self.symbol_results)}\n"
-        results_text += f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"TOTAL SYMBOLS: {total_symbols}\n")
+        parts.append(f"SECTIONS PROCESSED: {len(self.symbol_results)}\n")
+        parts.append(f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        results_text = "".join(parts)
         
-        text_widget.insert("1.0", results_text)
+        # Insert large reports in ~64 KB chunks so Tk re-wraps incrementally
+        chunk_size = 64 * 1024
+        for start in range(0, len(results_text), chunk_size):
+            text_widget.insert(tk.END, results_text[start:start + chunk_size])
         text_widget.configure(state="disabled")
     
     def export_excel(self):
@@ -623,35 +760,36 @@ class CountFireProApp(ctk.CTk):
         
         if filename:
             try:
-                # Create Excel report
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                # Create Excel report, streaming rows to disk instead of building the workbook in memory.
+                # constant_memory mode only keeps the current row, so each sheet is written top to bottom.
+                sheet_names = self._excel_sheet_names(self.symbol_results.keys())
+                workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
+                try:
                     # Summary sheet
-                    summary_data = []
-                    for section_name, results in self.symbol_results.items():
-                        summary_data.append({
-                            'Section': section_name,
-                            'Symbol Count': len(results['symbols']),
-                            'Processing Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        })
-                    
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                    processing_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    summary_rows = (
+                        (section_name, results['total_symbols'], processing_date)
+                        for section_name, results in self.symbol_results.items()
+                    )
+                    self._write_excel_sheet(workbook, 'Summary', ('Section', 'Symbol Count', 'Processing Date'), summary_rows)
                     
                     # Detail sheets for each section
                     for section_name, results in self.symbol_results.items():
-                        if results['symbols']:
-                            detail_data = []
-                            for i, symbol in enumerate(results['symbols']):
-                                detail_data.append({
-                                    'Symbol ID': i + 1,
-                                    'Area': symbol['area'],
-                                    'Center X': symbol['center'][0],
-                                    'Center Y': symbol['center'][1],
-                                    'Type': symbol['type']
-                                })
-                            
-                            detail_df = pd.DataFrame(detail_data)
-                            detail_df.to_excel(writer, sheet_name=f"{section_name[:30]}", index=False)
+                        if results['total_symbols']:
+                            columns = self.symbol_detector.get_symbol_arrays(results['symbols'])
+                            detail_rows = zip(
+                                range(1, results['total_symbols'] + 1),
+                                columns['area'].tolist(),
+                                columns['center_x'].tolist(),
+                                columns['center_y'].tolist(),
+                                columns['type'].tolist()
+                            )
+                            self._write_excel_sheet(
+                                workbook, sheet_names[section_name],
+                                ('Symbol ID', 'Area', 'Center X', 'Center Y', 'Type'), detail_rows
+                            )
+                finally:
+                    workbook.close()
                 
                 messagebox.showinfo("Success", f"Results exported to:\n{filename}")
                 self.set_status("Excel export completed")
@@ -659,19 +797,44 @@ class CountFireProApp(ctk.CTk):
             except Exception as e:
                 messagebox.showerror("Error", f"Export failed:\n{str(e)}")
     
+    def _excel_sheet_names(self, section_names):
+        """Map section names to unique, valid Excel sheet names"""
+        used = {'summary'}
+        sheet_names = {}
+        for section_name in section_names:
+            # Excel limits names to 31 characters, forbids []:*?/\ and leading or
+            # trailing apostrophes (strip after truncating, which can expose one)
+            base = section_name.translate(self._INVALID_SHEET_CHARS)[:31].strip("'") or "Section"
+            candidate = base
+            counter = 2
+            while candidate.lower() in used:
+                suffix = f" ({counter})"
+                candidate = base[:31 - len(suffix)] + suffix
+                counter += 1
+            
+            used.add(candidate.lower())
+            sheet_names[section_name] = candidate
+        
+        return sheet_names
+    
+    def _write_excel_sheet(self, workbook, sheet_name, header, rows):
+        """Add a worksheet and write the header and rows to it in order"""
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, header)
+        for row_index, row in enumerate(rows, start=1):
+            worksheet.write_row(row_index, 0, row)
+    
     def export_pdf(self):
         """Export results to PDF"""
         messagebox.showinfo("Info", "PDF export feature coming soon!")
     
     def zoom_in(self):
         """Zoom into the canvas"""
-        self.canvas_scale *= 1.25
-        self.display_image()
+        self._schedule_zoom(1.25)
     
     def zoom_out(self):
         """Zoom out of the canvas"""
-        self.canvas_scale /= 1.25
-        self.display_image()
+        self._schedule_zoom(1 / 1.25)
     
     def zoom_canvas(self, event):
         """Handle mouse wheel zoom"""
@@ -680,18 +843,84 @@ class CountFireProApp(ctk.CTk):
         else:
             self.zoom_out()
     
+    def _schedule_zoom(self, factor):
+        """Accumulate zoom steps and render them once after a short delay"""
+        if self._pending_zoom is None:
+            self._pending_zoom = self.zoom_factor
+        self._pending_zoom = min(max(self._pending_zoom * factor, 0.125), 8.0)
+        
+        if self._zoom_after is None:
+            self._zoom_after = self.after(30, self._apply_zoom)
+    
+    def _apply_zoom(self):
+        """Apply the accumulated zoom and redraw"""
+        self._zoom_after = None
+        if self._pending_zoom is None:
+            return
+        
+        self.zoom_factor = self._pending_zoom
+        self._pending_zoom = None
+        self.display_image()
+    
     def reset_view(self):
         """Reset canvas view to original"""
-        self.canvas_scale = 1.0
+        if self._zoom_after is not None:
+            self.after_cancel(self._zoom_after)
+            self._zoom_after = None
+        self._pending_zoom = None
+        
+        self.zoom_factor = 1.0
         self.display_image()
     
     def clear_drawings(self):
         """Clear all drawn rectangles"""
-        self.canvas.delete("rectangle")
         self.canvas.delete("temp_rect")
         self.drawing_rectangles = []
+        self._render_display()
         self.set_status("Drawings cleared")
     
+    def submit_job(self, fn, args, on_done, on_error):
+        """
+        Run fn(*args) on the background worker thread
+        
+        on_done(result) or on_error(message) is called on the main thread
+        once the job finishes.
+        """
+        self._jobs.put((fn, args, on_done, on_error))
+    
+    def _worker_loop(self):
+        """Run queued jobs one at a time on the background worker thread"""
+        while True:
+            fn, args, on_done, on_error = self._jobs.get()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self.post_to_ui(on_error, str(e))
+            else:
+                self.post_to_ui(on_done, result)
+    
+    def post_to_ui(self, callback, *args):
+        """
+        Schedule callback(*args) on the Tk main thread
+        
+        Safe to call from any thread; use this instead of self.after from
+        background threads.
+        """
+        self._ui_q.put((callback, args))
+    
+    def _pump_ui(self):
+        """Run queued UI callbacks on the main thread"""
+        try:
+            for _ in range(10):
+                try:
+                    callback, args = self._ui_q.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+        finally:
+            # Keep pumping even if a callback raised
+            self.after(16, self._pump_ui)
+    
     def set_status(self, message):
         """Update status message"""
         self.status_label.configure(text=message)
@@ -1,11 +1,59 @@
 import numpy as np
 from typing import Dict, List, Tuple, Any
 
+# Columnar layout for section rectangles (origin and size in image pixels)
+SECTION_DTYPE = np.dtype([('x', 'i4'), ('y', 'i4'), ('w', 'i4'), ('h', 'i4')])
+
 class SectionManager:
     """Manages document sections and their properties"""
     
     def __init__(self):
         self.sections = []
+        
+        # Parallel to self.sections: one name and one coordinate record per section
+        self.names = []
+        self.coordinates = np.empty(0, dtype=SECTION_DTYPE)
+        
+        # Label mask reused by get_combined_mask(reuse=True)
+        self._scratch_mask = None
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getitem__(self, index):
+        """Return the coordinate record (fields x, y, w, h) of a section as a view"""
+        return self.coordinates[index]
+    
+    def add_section(self, section: Dict):
+        """
+        Add a section to the managed list
+        
+        Args:
+            section: Section data dictionary from create_section
+        """
+        self.sections.append(section)
+        self.names.append(section['name'])
+        self.coordinates = np.concatenate([self.coordinates, self._coordinate_array([section])])
+    
+    def remove_section(self, index: int) -> Dict:
+        """
+        Remove a section from the managed list
+        
+        Args:
+            index: Position of the section
+            
+        Returns:
+            Dict: The removed section data
+        """
+        del self.names[index]
+        self.coordinates = np.delete(self.coordinates, index)
+        return self.sections.pop(index)
+    
+    def clear_sections(self):
+        """Remove all managed sections"""
+        self.sections.clear()
+        self.names.clear()
+        self.coordinates = np.empty(0, dtype=SECTION_DTYPE)
     
     def create_section(self, name: str, canvas_rect: Dict, img_width: int, img_height: int) -> Dict:
         """
@@ -51,26 +99,51 @@ class SectionManager:
         
         return section
     
-    def get_section_roi(self, image: np.ndarray, section: Dict) -> np.ndarray:
+    def clip_sections(self, sections: List[Dict], image_shape: Tuple) -> np.ndarray:
+        """
+        Clip the bounds of many sections to the image in one vectorized pass
+        
+        Args:
+            sections: List of section data dictionaries, or a SECTION_DTYPE array
+            image_shape: Shape of the image (height, width)
+            
+        Returns:
+            numpy.ndarray: (N, 4) int32 array of (x, y, x2, y2) rows, each at least 1x1
+        """
+        img_height, img_width = image_shape[:2]
+        coords = self._coordinate_array(sections)
+        
+        x = np.clip(coords['x'], 0, img_width - 1)
+        y = np.clip(coords['y'], 0, img_height - 1)
+        x2 = np.maximum(x + 1, np.minimum(x + coords['w'], img_width))
+        y2 = np.maximum(y + 1, np.minimum(y + coords['h'], img_height))
+        
+        return np.stack([x, y, x2, y2], axis=1).astype(np.int32)
+    
+    def get_section_roi(self, image: np.ndarray, section: Dict, bounds: Tuple = None) -> np.ndarray:
         """
         Extract region of interest from image based on section coordinates
         
         Args:
             image: Input image as numpy array
             section: Section data dictionary
+            bounds: Optional precomputed (x, y, x2, y2) row from clip_sections
             
         Returns:
             numpy.ndarray: ROI image section
         """
-        coords = section['coordinates']
-        
-        # Ensure coordinates are within image bounds
-        img_height, img_width = image.shape[:2]
-        
-        x = max(0, min(coords['x'], img_width - 1))
-        y = max(0, min(coords['y'], img_height - 1))
-        x2 = max(x + 1, min(x + coords['width'], img_width))
-        y2 = max(y + 1, min(y + coords['height'], img_height))
+        if bounds is not None:
+            x, y, x2, y2 = (int(v) for v in bounds)
+        else:
+            coords = section['coordinates']
+            
+            # Ensure coordinates are within image bounds
+            img_height, img_width = image.shape[:2]
+            
+            x = max(0, min(coords['x'], img_width - 1))
+            y = max(0, min(coords['y'], img_height - 1))
+            x2 = max(x + 1, min(x + coords['width'], img_width))
+            y2 = max(y + 1, min(y + coords['height'], img_height))
         
         # Extract ROI
         roi = image[y:y2, x:x2]
@@ -108,6 +181,40 @@ class SectionManager:
         
         return mask
     
+    def get_combined_mask(self, image_shape: Tuple, sections, reuse: bool = False) -> np.ndarray:
+        """
+        Create one label mask covering many sections
+        
+        Args:
+            image_shape: Shape of the original image (height, width)
+            sections: List of section data dictionaries, or a SECTION_DTYPE array
+            reuse: Fill the manager's scratch buffer instead of allocating a new mask.
+                The returned array is then overwritten by the next reusing call.
+            
+        Returns:
+            numpy.ndarray: Mask holding i + 1 inside section i (later sections win
+                where they overlap) and 0 elsewhere
+        """
+        dtype = np.uint8 if len(sections) < 256 else np.uint16
+        shape = tuple(image_shape[:2])
+        
+        if reuse:
+            if self._scratch_mask is None or self._scratch_mask.shape != shape or self._scratch_mask.dtype != dtype:
+                self._scratch_mask = np.zeros(shape, dtype=dtype)
+            else:
+                self._scratch_mask.fill(0)
+            mask = self._scratch_mask
+        else:
+            mask = np.zeros(shape, dtype=dtype)
+        
+        if len(sections) == 0:
+            return mask
+        
+        for label, (x, y, x2, y2) in enumerate(self.clip_sections(sections, image_shape).tolist(), start=1):
+            mask[y:y2, x:x2] = label
+        
+        return mask
+    
     def validate_section(self, section: Dict, image_shape: Tuple) -> bool:
         """
         Validate if section coordinates are valid for given image
@@ -119,24 +226,37 @@ class SectionManager:
         Returns:
             bool: True if section is valid, False otherwise
         """
-        coords = section['coordinates']
-        img_height, img_width = image_shape[:2]
-        
-        # Check if coordinates are within image bounds
-        if (coords['x'] < 0 or coords['y'] < 0 or 
-            coords['x'] >= img_width or coords['y'] >= img_height):
-            return False
+        return bool(self.validate_sections([section], image_shape)[0])
+    
+    def validate_sections(self, sections: List[Dict], image_shape: Tuple) -> np.ndarray:
+        """
+        Validate many sections against the image in one vectorized pass
         
-        # Check if section has positive dimensions
-        if coords['width'] <= 0 or coords['height'] <= 0:
-            return False
+        Args:
+            sections: List of section data dictionaries, or a SECTION_DTYPE array
+            image_shape: Shape of the image (height, width)
+            
+        Returns:
+            numpy.ndarray: Boolean array, True where the section is valid
+        """
+        img_height, img_width = image_shape[:2]
+        coords = self._coordinate_array(sections)
         
-        # Check if section extends beyond image bounds
-        if (coords['x'] + coords['width'] > img_width or 
-            coords['y'] + coords['height'] > img_height):
-            return False
+        # Widen so x + w cannot overflow the int32 columns
+        x, y = coords['x'].astype(np.int64), coords['y'].astype(np.int64)
+        w, h = coords['w'].astype(np.int64), coords['h'].astype(np.int64)
         
-        return True
+        # Positive dimensions, starting inside the image and not extending beyond it
+        return (w > 0) & (h > 0) & (x >= 0) & (y >= 0) & (x + w <= img_width) & (y + h <= img_height)
+    
+    def _coordinate_array(self, sections) -> np.ndarray:
+        """Pack section coordinates into a SECTION_DTYPE array (passed through if already one)"""
+        if isinstance(sections, np.ndarray) and sections.dtype == SECTION_DTYPE:
+            return sections
+        coords = [section['coordinates'] for section in sections]
+        return np.array(
+            [(c['x'], c['y'], c['width'], c['height']) for c in coords], dtype=SECTION_DTYPE
+        )
     
     def get_section_info(self, section: Dict) -> Dict:
         """
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("customtkinter")
+xlsxwriter = pytest.importorskip("xlsxwriter")
+
+import desktop_app
+from desktop_app import CountFireProApp
+from symbol_detector import SymbolDetector
+
+
+def sheet_names(section_names):
+    # The sanitizer only reads class state, so no Tk window is needed
+    return CountFireProApp._excel_sheet_names(CountFireProApp.__new__(CountFireProApp), section_names)
+
+
+def test_sheet_names_are_valid_for_xlsxwriter(tmp_path):
+    section_names = [
+        "x" * 30 + "'tail",          # Truncation exposes a trailing apostrophe
+        "'quoted'",
+        "a[b]c:d*e?f/g\\h",
+        "'''",                       # Nothing left after sanitizing
+        "[]",
+        "Summary",
+        "SUMMARY",
+        "y" * 40,
+        "y" * 31 + "other",          # Collides with the previous name once truncated
+        "Floor 1",
+        "floor 1",
+    ]
+    names = sheet_names(section_names)
+    
+    assert list(names) == section_names
+    assert names["x" * 30 + "'tail"] == "x" * 30
+    assert names["'quoted'"] == "quoted"
+    assert names["a[b]c:d*e?f/g\\h"] == "abcdefgh"
+    assert names["'''"] == "Section"
+    assert names["[]"] == "Section (2)"
+    assert names["Summary"] == "Summary (2)"
+    assert names["SUMMARY"] == "SUMMARY (3)"
+    assert names["y" * 40] == "y" * 31
+    assert names["y" * 31 + "other"] == "y" * 27 + " (2)"
+    assert names["floor 1"] == "floor 1 (2)"
+    
+    # Sheet names are unique ignoring case, and xlsxwriter accepts every one of them
+    assert len({name.lower() for name in names.values()} | {"summary"}) == len(names) + 1
+    workbook = xlsxwriter.Workbook(str(tmp_path / "names.xlsx"))
+    workbook.add_worksheet("Summary")
+    for name in names.values():
+        workbook.add_worksheet(name)
+    workbook.close()
+
+
+def test_export_excel_writes_summary_and_detail_rows(tmp_path, monkeypatch):
+    openpyxl = pytest.importorskip("openpyxl")
+    filename = tmp_path / "report.xlsx"
+    errors = []
+    monkeypatch.setattr(desktop_app.filedialog, "asksaveasfilename", lambda **kwargs: str(filename))
+    monkeypatch.setattr(desktop_app.messagebox, "showinfo", lambda *args: None)
+    monkeypatch.setattr(desktop_app.messagebox, "showerror", lambda *args: errors.append(args))
+    
+    symbols = [
+        {'area': 120.5, 'center': (10, 20), 'type': 'Circular'},
+        {'area': 64.0, 'center': (30, 40), 'type': 'Square'},
+    ]
+    app = CountFireProApp.__new__(CountFireProApp)
+    app.symbol_detector = SymbolDetector()
+    app.set_status = lambda message: None
+    app.symbol_results = {
+        'Floor 1': {'symbols': symbols, 'total_symbols': 2},
+        'Empty': {'symbols': [], 'total_symbols': 0},
+    }
+    
+    app.export_excel()
+    
+    assert errors == []
+    workbook = openpyxl.load_workbook(filename)
+    assert workbook.sheetnames == ['Summary', 'Floor 1']
+    summary = list(workbook['Summary'].values)
+    assert summary[0] == ('Section', 'Symbol Count', 'Processing Date')
+    assert [row[:2] for row in summary[1:]] == [('Floor 1', 2), ('Empty', 0)]
+    assert list(workbook['Floor 1'].values) == [
+        ('Symbol ID', 'Area', 'Center X', 'Center Y', 'Type'),
+        (1, 120.5, 10, 20, 'Circular'),
+        (2, 64, 30, 40, 'Square'),
+    ]
+
+
+def test_draw_rectangles_scales_boxes_onto_a_copy():
+    app = CountFireProApp.__new__(CountFireProApp)
+    app.current_image_rgb = np.zeros((1000, 2000, 3), dtype=np.uint8)
+    app.drawing_rectangles = [
+        {'image_coords': (200, 200, 400, 200)},
+        {'image_coords': (400, 300, 400, 200)},    # Overlaps the first box
+        {'image_coords': (5000, 5000, 10, 10)},    # Entirely off the page
+    ]
+    base = np.full((500, 1000, 3), 100, dtype=np.uint8)  # Half-scale display
+    
+    display = app._draw_rectangles(base)
+    
+    assert display is not base and (base == 100).all()
+    tint = np.round(np.array([100, 100, 100]) * 204 / 255) + np.array([51, 0, 0])
+    assert display[130, 150].tolist() == tint.tolist()   # Inside the first box only
+    assert display[170, 250].tolist() == tint.tolist()   # Overlap is tinted once
+    assert display[230, 150].tolist() == [100, 100, 100]  # Inside the union's bounding box, outside both boxes
+    assert display[60, 350].tolist() == [100, 100, 100]  # Outside every box
+    assert display[100, 150].tolist() == [255, 0, 0]     # Outline
+
+
+class FakeCanvas:
+    def winfo_width(self):
+        return 800
+    
+    def winfo_height(self):
+        return 600
+
+
+def test_zoom_stops_at_max_display_scale():
+    app = CountFireProApp.__new__(CountFireProApp)
+    app.canvas = FakeCanvas()
+    app.current_image = np.zeros((1440, 1920, 3), dtype=np.uint8)
+    app.pyramid = None
+    app._last_render_key = None
+    app._render_display = lambda: None   # Only the resized base is checked, no Tk image
+    
+    app.zoom_factor = 100.0
+    app.display_image()
+    
+    assert app.canvas_scale == pytest.approx(CountFireProApp._MAX_DISPLAY_SCALE)
+    assert app._display_base.shape[:2] == (2880, 3840)
+    
+    # The cap is folded back into zoom_factor, so one zoom-out step shrinks the view
+    app.zoom_factor /= 1.25
+    app.display_image()
+    assert app._display_base.shape[:2] == (2304, 3072)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from section_manager import SECTION_DTYPE, SectionManager
+
+
+def make_section(x, y, width, height, name='S'):
+    return {
+        'name': name,
+        'coordinates': {'x': int(x), 'y': int(y), 'width': int(width), 'height': int(height)},
+        'area': int(width * height)
+    }
+
+
+def random_sections(count, image_shape, seed=0):
+    """Sections that start or end inside, outside and across the image edges"""
+    rng = np.random.default_rng(seed)
+    img_height, img_width = image_shape
+    return [
+        make_section(
+            rng.integers(-50, img_width + 50), rng.integers(-50, img_height + 50),
+            rng.integers(-10, img_width), rng.integers(-10, img_height), name=f'S{i}'
+        )
+        for i in range(count)
+    ]
+
+
+def reference_bounds(section, image_shape):
+    """Scalar clamping used by get_section_roi before it was vectorized"""
+    coords = section['coordinates']
+    img_height, img_width = image_shape[:2]
+    x = max(0, min(coords['x'], img_width - 1))
+    y = max(0, min(coords['y'], img_height - 1))
+    x2 = max(x + 1, min(x + coords['width'], img_width))
+    y2 = max(y + 1, min(y + coords['height'], img_height))
+    return [x, y, x2, y2]
+
+
+def reference_valid(section, image_shape):
+    """if-chain used by validate_section before it was vectorized"""
+    coords = section['coordinates']
+    img_height, img_width = image_shape[:2]
+    if coords['x'] < 0 or coords['y'] < 0 or coords['x'] >= img_width or coords['y'] >= img_height:
+        return False
+    if coords['width'] <= 0 or coords['height'] <= 0:
+        return False
+    if coords['x'] + coords['width'] > img_width or coords['y'] + coords['height'] > img_height:
+        return False
+    return True
+
+
+@pytest.mark.parametrize('image_shape', [(1080, 1920), (300, 200), (1, 1)])
+def test_clip_sections_matches_scalar_clamping(image_shape):
+    manager = SectionManager()
+    sections = random_sections(2000, image_shape)
+    
+    bounds = manager.clip_sections(sections, image_shape)
+    
+    assert bounds.dtype == np.int32
+    assert bounds.tolist() == [reference_bounds(s, image_shape) for s in sections]
+
+
+@pytest.mark.parametrize('image_shape', [(1080, 1920), (300, 200), (1, 1)])
+def test_validate_sections_matches_scalar_checks(image_shape):
+    manager = SectionManager()
+    sections = random_sections(2000, image_shape)
+    
+    valid = manager.validate_sections(sections, image_shape)
+    
+    assert valid.tolist() == [reference_valid(s, image_shape) for s in sections]
+    assert [manager.validate_section(s, image_shape) for s in sections[:50]] == valid[:50].tolist()
+
+
+def test_get_section_roi_uses_clipped_bounds():
+    manager = SectionManager()
+    image = np.arange(300 * 200 * 3, dtype=np.uint8).reshape(300, 200, 3)
+    for section in random_sections(200, image.shape[:2]):
+        x, y, x2, y2 = reference_bounds(section, image.shape)
+        bounds = manager.clip_sections([section], image.shape)[0]
+        assert np.array_equal(manager.get_section_roi(image, section, bounds), image[y:y2, x:x2])
+        assert np.array_equal(manager.get_section_roi(image, section), image[y:y2, x:x2])
+
+
+def test_coordinates_array_tracks_sections():
+    manager = SectionManager()
+    sections = random_sections(5, (1080, 1920))
+    for section in sections:
+        manager.add_section(section)
+    manager.remove_section(1)
+    
+    expected = [s for i, s in enumerate(sections) if i != 1]
+    assert manager.coordinates.dtype == SECTION_DTYPE
+    assert manager.names == [s['name'] for s in expected]
+    assert (manager.clip_sections(manager.coordinates, (1080, 1920)).tolist()
+            == manager.clip_sections(expected, (1080, 1920)).tolist())
+    
+    manager.clear_sections()
+    assert len(manager) == 0 and manager.sections == []
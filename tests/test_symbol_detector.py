@@ -0,0 +1,179 @@
+import cv2
+import numpy as np
+import pytest
+
+from section_manager import SectionManager
+from symbol_detector import SymbolDetector
+
+
+def make_page(speckle=0.0, seed=0, shape=(1440, 1920)):
+    """Synthetic drawing page: filled and outlined shapes, optional salt speckle"""
+    rng = np.random.default_rng(seed)
+    height, width = shape
+    page = np.full((height, width, 3), 255, dtype=np.uint8)
+    for i in range(300):
+        x, y = int(rng.integers(30, width - 40)), int(rng.integers(30, height - 40))
+        kind = i % 4
+        if kind == 0:
+            cv2.circle(page, (x, y), int(rng.integers(6, 20)), (0, 0, 0), -1)
+        elif kind == 1:
+            cv2.rectangle(page, (x, y), (x + int(rng.integers(8, 30)), y + int(rng.integers(8, 30))), (0, 0, 0), -1)
+        elif kind == 2:
+            cv2.rectangle(page, (x, y), (x + 30, y + 12), (0, 0, 0), 2)
+        else:
+            cv2.fillPoly(page, [np.array([[x, y], [x + 20, y], [x + 10, y - 18]])], (0, 0, 0))
+    if speckle:
+        page[rng.random(shape) < speckle] = 0
+    return page
+
+
+def full_page_section(page):
+    height, width = page.shape[:2]
+    return SectionManager().create_section(
+        'Page', {'left': 0, 'top': 0, 'width': width, 'height': height}, width, height
+    )
+
+
+def symbol_keys(symbols):
+    return sorted((s['center'], s['type'], s['area'], tuple(s['bounding_box'])) for s in symbols)
+
+
+def reference_symbols(detector, page, section, min_area, max_area):
+    """Full-resolution detection straight from findContours, with no shortcuts"""
+    detector.min_contour_area = min_area
+    detector.max_contour_area = max_area
+    contours, _ = cv2.findContours(detector._preprocess_image(page), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return detector._analyze_contours(contours, section, None, (0, 0))
+
+
+@pytest.mark.parametrize('min_area', [50, 200])
+def test_full_page_section_matches_full_resolution(min_area):
+    # A 1920x1440 page is within the loader's size cap, so a full-page section is realistic
+    page = make_page(speckle=0.003)
+    section = full_page_section(page)
+    detector = SymbolDetector()
+    
+    expected = symbol_keys(reference_symbols(SymbolDetector(), page, section, min_area, 5000))
+    single = detector.detect_symbols_in_section(page, section, min_area=min_area, max_area=5000)
+    multi = detector.detect_symbols_in_sections(page, [section], min_area=min_area, max_area=5000)
+    
+    assert symbol_keys(single['symbols']) == expected
+    assert symbol_keys(multi['Page']['symbols']) == expected
+
+
+def test_process_and_thread_paths_agree():
+    page = make_page(speckle=0.003)
+    height, width = page.shape[:2]
+    manager = SectionManager()
+    sections = [
+        manager.create_section(f'S{i}', {'left': i * 450 - 40, 'top': 80 * i, 'width': 600, 'height': 900},
+                               width, height)
+        for i in range(5)
+    ]
+    detector = SymbolDetector()
+    
+    threaded = detector.detect_symbols_in_sections(page, sections, min_area=50, max_area=5000)
+    try:
+        processes = detector.detect_symbols_in_sections(page, sections, min_area=50, max_area=5000,
+                                                        use_processes=True, max_workers=2)
+        first_pool = detector._process_pool
+        
+        # A different worker count replaces the pool instead of silently reusing it
+        again = detector.detect_symbols_in_sections(page, sections, min_area=50, max_area=5000,
+                                                    use_processes=True, max_workers=1)
+        assert detector._process_pool is not first_pool
+        assert detector._process_pool_workers == 1
+    finally:
+        detector.shutdown()
+    
+    assert detector._process_pool is None
+    assert list(threaded) == list(processes) == [s['name'] for s in sections]
+    for name in threaded:
+        assert threaded[name]['total_symbols'] > 0
+        assert symbol_keys(processes[name]['symbols']) == symbol_keys(threaded[name]['symbols'])
+        assert symbol_keys(again[name]['symbols']) == symbol_keys(threaded[name]['symbols'])
+
+
+def test_speckle_does_not_create_symbols():
+    clean = make_page()
+    noisy = make_page(speckle=0.003)
+    detector = SymbolDetector()
+    
+    clean_count = detector.detect_symbols_in_section(clean, full_page_section(clean), min_area=50)['total_symbols']
+    noisy_count = detector.detect_symbols_in_section(noisy, full_page_section(noisy), min_area=50)['total_symbols']
+    
+    assert abs(noisy_count - clean_count) <= 0.05 * clean_count
+
+
+def reference_classify(circularity, aspect_ratio, solidity):
+    """if/elif chain used by _classify_symbol before it was vectorized"""
+    if circularity > 0.7 and abs(aspect_ratio - 1.0) < 0.3:
+        return "Circular"
+    elif solidity > 0.8 and (abs(aspect_ratio - 1.0) < 0.2 or abs(aspect_ratio - 1.0) > 0.5):
+        if abs(aspect_ratio - 1.0) < 0.2:
+            return "Square"
+        else:
+            return "Rectangle"
+    elif solidity < 0.7 and circularity < 0.6:
+        return "Triangle"
+    elif solidity < 0.8:
+        return "Complex"
+    else:
+        return "Other"
+
+
+def test_classify_symbols_matches_decision_chain():
+    # Every threshold, values just either side of it, and random fill
+    rng = np.random.default_rng(0)
+    edges = [0.0, 0.2, 0.3, 0.5, 0.6, 0.7, 0.8, 1.0]
+    circularity = np.unique(np.concatenate([edges, np.nextafter(edges, -1), np.nextafter(edges, 2), rng.random(20)]))
+    aspect = np.unique(np.concatenate([[1.0 + d for d in (-0.5, -0.3, -0.2, 0.0, 0.2, 0.3, 0.5)],
+                                       [0.0, 0.1, 10.0], rng.uniform(0.1, 3.0, 20)]))
+    aspect = np.unique(np.concatenate([aspect, np.nextafter(aspect, -1), np.nextafter(aspect, 20)]))
+    solidity = circularity
+    
+    properties = [
+        {'circularity': c, 'aspect_ratio': a, 'solidity': s}
+        for c in circularity.tolist() for a in aspect.tolist() for s in solidity.tolist()
+    ]
+    detector = SymbolDetector()
+    
+    expected = [reference_classify(p['circularity'], p['aspect_ratio'], p['solidity']) for p in properties]
+    assert detector._classify_symbols(properties) == expected
+    assert [detector._classify_symbol(p) for p in properties[:200]] == expected[:200]
+    assert detector._classify_symbols([]) == []
+
+
+def contours_at_least(contours, min_area):
+    return [c for c in contours if cv2.contourArea(c) >= min_area]
+
+
+@pytest.mark.parametrize('min_area', [1, 20, 50, 200])
+@pytest.mark.parametrize('speckle', [0.0, 0.003, 0.02])
+def test_component_prefilter_keeps_every_qualifying_contour(min_area, speckle):
+    detector = SymbolDetector()
+    binary = detector._preprocess_image(make_page(speckle=speckle))
+    
+    filtered = contours_at_least(detector._find_contours(binary, min_area), min_area)
+    unfiltered = contours_at_least(detector._find_contours(binary), min_area)
+    
+    assert len(filtered) == len(unfiltered)
+    assert all(np.array_equal(a, b) for a, b in zip(filtered, unfiltered))
+
+
+def test_component_prefilter_keeps_blobs_nested_in_holes():
+    # A ring with a speck and a large blob inside its hole: RETR_EXTERNAL only
+    # reports the ring, with or without the pre-filter
+    binary = np.zeros((200, 200), dtype=np.uint8)
+    cv2.rectangle(binary, (20, 20), (180, 180), 255, 3)
+    cv2.circle(binary, (100, 100), 30, 255, -1)
+    binary[50, 50] = 255
+    binary[5, 5] = 255
+    
+    detector = SymbolDetector()
+    filtered = detector._find_contours(binary, 50)
+    unfiltered = contours_at_least(detector._find_contours(binary), 50)
+    
+    assert len(filtered) == len(unfiltered) == 1
+    assert np.array_equal(filtered[0], unfiltered[0])
+    assert detector._find_contours(np.zeros((10, 10), dtype=np.uint8), 50) == []